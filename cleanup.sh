@@ -23,6 +23,7 @@ KEEP_SCRIPTS=(
   "update_pillar_order.py"
   "apply_styling.py"
   "generate_wafr_pages_updated.py"
+  "docs_listing.py"
 )
 
 # Remove all scripts except the ones we want to keep
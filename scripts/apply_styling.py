@@ -5,11 +5,181 @@ Script to apply custom styling to all question pages.
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from docs_listing import entry_names
+
+# Patterns used by convert_to_styled_format, compiled once per process
+FRONT_MATTER_RE = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
+TITLE_RE = re.compile(r'# ([A-Z]+\d+): (.*?)\n')
+DESCRIPTION_RE = re.compile(r'# [A-Z]+\d+: .*?\n\n(.*?)\n\n', re.DOTALL)
+TITLE_ONLY_RE = re.compile(r'# [A-Z]+\d+: .*?\n\n')
+PRACTICE_ITEM_RE = re.compile(r'### (.*?)\n(.*?)(?=\n###|\Z)', re.DOTALL)
+IMPL_STEP_RE = re.compile(r'\d+\.\s+\*\*(.*?)\*\*:(.*?)(?=\n\d+\.|\Z)', re.DOTALL)
+NUMBERED_ITEM_RE = re.compile(r'(\d+\.\s+.*?)(?=\n\d+\.|\Z)', re.DOTALL)
+NUMBER_PREFIX_RE = re.compile(r'^\d+\.\s+')
+SERVICE_ITEM_RE = re.compile(r'- \*\*(.*?)\*\* - (.*?)(?=\n-|\Z)', re.DOTALL)
+LIST_ITEM_RE = re.compile(r'- (.*?)(?=\n-|\Z)', re.DOTALL)
+LINK_RE = re.compile(r'- \[(.*?)\]\((.*?)\)')
+SECTION_HEADING_RE = re.compile(r'^(## .+)$', re.MULTILINE)
+
+# Styling takes about 35us a page in-process and starting a process pool about 40ms, so the
+# pool only pays off for trees far larger than the current ~250 pages and on more than one core
+PARALLEL_MIN_FILES = 2000
+
+# Templates for the styled section blocks
+BEST_PRACTICE_TEMPLATE = """<div class="best-practice">
+  <h4>{title}</h4>
+  <p>{body}</p>
+</div>
+
+"""
+
+IMPLEMENTATION_STEP_TEMPLATE = """<div class="implementation-step">
+  <h4>{title}</h4>
+  <p>{body}</p>
+</div>
+
+"""
+
+AWS_SERVICE_TEMPLATE = """<div class="aws-service">
+  <div class="aws-service-content">
+    <h4>{name}</h4>
+    <p>{description}</p>
+  </div>
+</div>
+
+"""
+
+RELATED_RESOURCES_HEADER = """<div class="related-resources">
+  <h2>Related Resources</h2>
+  <ul>
+"""
+RESOURCE_LINK_TEMPLATE = '    <li><a href="{url}">{name}</a></li>\n'
+RESOURCE_ITEM_TEMPLATE = '    <li>{text}</li>\n'
+RELATED_RESOURCES_FOOTER = "  </ul>\n</div>"
+
+def style_best_practices(best_practices_content):
+    """Style the body of a Best Practices section."""
+    parts = []
+    
+    # Find all best practices
+    practices = PRACTICE_ITEM_RE.findall(best_practices_content)
+    if practices:
+        for practice_title, practice_content in practices:
+            parts.append(BEST_PRACTICE_TEMPLATE.format(title=practice_title, body=practice_content.strip()))
+    else:
+        # If no ### headings, just wrap the whole content
+        parts.append(BEST_PRACTICE_TEMPLATE.format(title='Best Practice', body=best_practices_content.strip()))
+    
+    return "## Best Practices\n\n" + "".join(parts)
+
+def style_implementation_guidance(impl_content):
+    """Style the body of an Implementation Guidance section."""
+    parts = []
+    
+    # Find all implementation steps
+    steps = IMPL_STEP_RE.findall(impl_content)
+    if steps:
+        for i, (step_title, step_content) in enumerate(steps, 1):
+            parts.append(IMPLEMENTATION_STEP_TEMPLATE.format(title=f'{i}. {step_title}', body=step_content.strip()))
+    else:
+        # If no numbered steps with bold titles, try to find numbered items
+        steps = NUMBERED_ITEM_RE.findall(impl_content)
+        if steps:
+            for i, step_content in enumerate(steps, 1):
+                step_text = step_content.strip()
+                step_text = NUMBER_PREFIX_RE.sub('', step_text)
+                parts.append(IMPLEMENTATION_STEP_TEMPLATE.format(title=f'Step {i}', body=step_text))
+        else:
+            # If no structure found, just wrap the whole content
+            parts.append(IMPLEMENTATION_STEP_TEMPLATE.format(title='Implementation Guidance', body=impl_content.strip()))
+    
+    return "## Implementation Guidance\n\n" + "".join(parts)
+
+def style_aws_services(services_content):
+    """Style the body of an AWS Services to Consider section."""
+    parts = []
+    
+    # Find all services
+    services = SERVICE_ITEM_RE.findall(services_content)
+    if services:
+        for service_name, service_desc in services:
+            parts.append(AWS_SERVICE_TEMPLATE.format(name=service_name, description=service_desc.strip()))
+    else:
+        # If no structured services, try to find simple list items
+        services = LIST_ITEM_RE.findall(services_content)
+        if services:
+            for service in services:
+                parts.append(AWS_SERVICE_TEMPLATE.format(name=service.strip(), description='AWS service for this question.'))
+        else:
+            # If no structure found, just add a placeholder
+            parts.append(AWS_SERVICE_TEMPLATE.format(name='AWS Services', description='Add relevant AWS services for this question.'))
+    
+    return "## AWS Services to Consider\n\n" + "".join(parts)
+
+def style_related_resources(resources_content):
+    """Style the body of a Related Resources section."""
+    parts = [RELATED_RESOURCES_HEADER]
+    
+    # Find all resources
+    resources = LINK_RE.findall(resources_content)
+    if resources:
+        for resource_name, resource_url in resources:
+            parts.append(RESOURCE_LINK_TEMPLATE.format(name=resource_name, url=resource_url))
+    else:
+        # If no structured links, try to find simple list items
+        resources = LIST_ITEM_RE.findall(resources_content)
+        if resources:
+            for resource in resources:
+                parts.append(RESOURCE_ITEM_TEMPLATE.format(text=resource.strip()))
+        else:
+            # If no structure found, just add a placeholder
+            parts.append(RESOURCE_ITEM_TEMPLATE.format(text='Add related resources for this question.'))
+    
+    parts.append(RELATED_RESOURCES_FOOTER)
+    
+    return "".join(parts)
+
+SECTION_STYLERS = {
+    '## Best Practices': style_best_practices,
+    '## Implementation Guidance': style_implementation_guidance,
+    '## AWS Services to Consider': style_aws_services,
+    '## Related Resources': style_related_resources
+}
+
+def style_sections(content):
+    """Rewrite every known ## section of the content in a single pass."""
+    # Leave pages with no known section heading untouched
+    if not any(heading in content for heading in SECTION_STYLERS):
+        return content
+    
+    # Splitting on the headings yields [prefix, heading1, body1, heading2, body2, ...]
+    sections = SECTION_HEADING_RE.split(content)
+    parts = [sections[0]]
+    
+    for i in range(1, len(sections), 2):
+        heading, body = sections[i], sections[i + 1]
+        styler = SECTION_STYLERS.get(heading)
+        if styler is None or not body.startswith('\n\n'):
+            parts.append(heading + body)
+            continue
+        
+        section_content = body[2:]
+        trailing = ''
+        if i + 2 < len(sections):
+            # Keep the newline that separates this section from the next heading
+            section_content, trailing = section_content[:-1], section_content[-1:]
+        
+        parts.append(styler(section_content) + trailing)
+    
+    return ''.join(parts)
 
 def convert_to_styled_format(content):
     """Convert standard markdown to styled format with custom classes."""
     # Extract front matter
-    front_matter_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
+    front_matter_match = FRONT_MATTER_RE.match(content)
     if not front_matter_match:
         return content
     
@@ -17,7 +187,7 @@ def convert_to_styled_format(content):
     content_without_front_matter = content[len(front_matter):]
     
     # Extract title and description
-    title_match = re.search(r'# ([A-Z]+\d+): (.*?)\n', content_without_front_matter)
+    title_match = TITLE_RE.search(content_without_front_matter)
     if not title_match:
         return content
     
@@ -25,7 +195,7 @@ def convert_to_styled_format(content):
     question_title = title_match.group(2)
     
     # Find the first paragraph after the title
-    description_match = re.search(r'# [A-Z]+\d+: .*?\n\n(.*?)\n\n', content_without_front_matter, re.DOTALL)
+    description_match = DESCRIPTION_RE.search(content_without_front_matter)
     description = description_match.group(1) if description_match else "*This page contains guidance for addressing this question from the AWS Well-Architected Framework.*"
     
     # Create the new header
@@ -37,169 +207,45 @@ def convert_to_styled_format(content):
 """
     
     # Replace the old header
-    content_without_header = re.sub(r'# [A-Z]+\d+: .*?\n\n(.*?)\n\n', '', content_without_front_matter, 1, re.DOTALL)
+    content_without_header = DESCRIPTION_RE.sub('', content_without_front_matter, 1)
     if not content_without_header:
-        content_without_header = re.sub(r'# [A-Z]+\d+: .*?\n\n', '', content_without_front_matter, 1)
+        content_without_header = TITLE_ONLY_RE.sub('', content_without_front_matter, 1)
     
-    # Style best practices
-    styled_content = content_without_header
+    # Style the known sections
+    styled_content = style_sections(content_without_header)
     
-    # Replace best practices section
-    best_practices_match = re.search(r'## Best Practices\n\n(.*?)(?=\n##|\Z)', styled_content, re.DOTALL)
-    if best_practices_match:
-        best_practices_content = best_practices_match.group(1)
-        styled_best_practices = "## Best Practices\n\n"
-        
-        # Find all best practices
-        practices = re.findall(r'### (.*?)\n(.*?)(?=\n###|\Z)', best_practices_content, re.DOTALL)
-        if practices:
-            for practice_title, practice_content in practices:
-                styled_best_practices += f"""<div class="best-practice">
-  <h4>{practice_title}</h4>
-  <p>{practice_content.strip()}</p>
-</div>
-
-"""
-        else:
-            # If no ### headings, just wrap the whole content
-            styled_best_practices += f"""<div class="best-practice">
-  <h4>Best Practice</h4>
-  <p>{best_practices_content.strip()}</p>
-</div>
+    # Combine everything
+    return front_matter + new_header + styled_content
 
-"""
-        
-        styled_content = styled_content.replace(best_practices_match.group(0), styled_best_practices)
+def process_file(filepath):
+    """Apply styling to a single markdown file."""
+    path = Path(filepath)
+    content = path.read_text(encoding='utf-8')
     
-    # Replace implementation guidance
-    impl_match = re.search(r'## Implementation Guidance\n\n(.*?)(?=\n##|\Z)', styled_content, re.DOTALL)
-    if impl_match:
-        impl_content = impl_match.group(1)
-        styled_impl = "## Implementation Guidance\n\n"
-        
-        # Find all implementation steps
-        steps = re.findall(r'\d+\.\s+\*\*(.*?)\*\*:(.*?)(?=\n\d+\.|\Z)', impl_content, re.DOTALL)
-        if steps:
-            for i, (step_title, step_content) in enumerate(steps, 1):
-                styled_impl += f"""<div class="implementation-step">
-  <h4>{i}. {step_title}</h4>
-  <p>{step_content.strip()}</p>
-</div>
-
-"""
-        else:
-            # If no numbered steps with bold titles, try to find numbered items
-            steps = re.findall(r'(\d+\.\s+.*?)(?=\n\d+\.|\Z)', impl_content, re.DOTALL)
-            if steps:
-                for i, step_content in enumerate(steps, 1):
-                    step_text = step_content.strip()
-                    step_text = re.sub(r'^\d+\.\s+', '', step_text)
-                    styled_impl += f"""<div class="implementation-step">
-  <h4>Step {i}</h4>
-  <p>{step_text}</p>
-</div>
-
-"""
-            else:
-                # If no structure found, just wrap the whole content
-                styled_impl += f"""<div class="implementation-step">
-  <h4>Implementation Guidance</h4>
-  <p>{impl_content.strip()}</p>
-</div>
-
-"""
-        
-        styled_content = styled_content.replace(impl_match.group(0), styled_impl)
+    styled_content = convert_to_styled_format(content)
     
-    # Replace AWS services section
-    services_match = re.search(r'## AWS Services to Consider\n\n(.*?)(?=\n##|\Z)', styled_content, re.DOTALL)
-    if services_match:
-        services_content = services_match.group(1)
-        styled_services = "## AWS Services to Consider\n\n"
-        
-        # Find all services
-        services = re.findall(r'- \*\*(.*?)\*\* - (.*?)(?=\n-|\Z)', services_content, re.DOTALL)
-        if services:
-            for service_name, service_desc in services:
-                styled_services += f"""<div class="aws-service">
-  <div class="aws-service-content">
-    <h4>{service_name}</h4>
-    <p>{service_desc.strip()}</p>
-  </div>
-</div>
-
-"""
-        else:
-            # If no structured services, try to find simple list items
-            services = re.findall(r'- (.*?)(?=\n-|\Z)', services_content, re.DOTALL)
-            if services:
-                for service in services:
-                    styled_services += f"""<div class="aws-service">
-  <div class="aws-service-content">
-    <h4>{service.strip()}</h4>
-    <p>AWS service for this question.</p>
-  </div>
-</div>
+    if styled_content != content:
+        path.write_text(styled_content, encoding='utf-8')
+    
+    return filepath
 
-"""
-            else:
-                # If no structure found, just add a placeholder
-                styled_services += """<div class="aws-service">
-  <div class="aws-service-content">
-    <h4>AWS Services</h4>
-    <p>Add relevant AWS services for this question.</p>
-  </div>
-</div>
+def list_question_files(directory):
+    """Return the paths of the question pages in a directory."""
+    filepaths = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.md') and not entry.name == 'index.md':
+                filepaths.append(entry.path)
+    return filepaths
 
-"""
-        
-        styled_content = styled_content.replace(services_match.group(0), styled_services)
+def process_files(filepaths):
+    """Style every file, yielding each path once it has been processed."""
+    if len(filepaths) < PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+        yield from map(process_file, filepaths)
+        return
     
-    # Replace related resources section
-    resources_match = re.search(r'## Related Resources\n\n(.*?)(?=\n##|\Z)', styled_content, re.DOTALL)
-    if resources_match:
-        resources_content = resources_match.group(1)
-        styled_resources = """<div class="related-resources">
-  <h2>Related Resources</h2>
-  <ul>
-"""
-        
-        # Find all resources
-        resources = re.findall(r'- \[(.*?)\]\((.*?)\)', resources_content)
-        if resources:
-            for resource_name, resource_url in resources:
-                styled_resources += f'    <li><a href="{resource_url}">{resource_name}</a></li>\n'
-        else:
-            # If no structured links, try to find simple list items
-            resources = re.findall(r'- (.*?)(?=\n-|\Z)', resources_content, re.DOTALL)
-            if resources:
-                for resource in resources:
-                    styled_resources += f'    <li>{resource.strip()}</li>\n'
-            else:
-                # If no structure found, just add a placeholder
-                styled_resources += '    <li>Add related resources for this question.</li>\n'
-        
-        styled_resources += "  </ul>\n</div>"
-        
-        styled_content = styled_content.replace(resources_match.group(0), styled_resources)
-    
-    # Combine everything
-    return front_matter + new_header + styled_content
-
-def process_directory(directory):
-    """Process all markdown files in a directory."""
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        if os.path.isfile(filepath) and filepath.endswith('.md') and not filename == 'index.md':
-            with open(filepath, 'r') as file:
-                content = file.read()
-            
-            styled_content = convert_to_styled_format(content)
-            
-            with open(filepath, 'w') as file:
-                file.write(styled_content)
-            
-            print(f"Styled {filepath}")
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(process_file, filepaths, chunksize=8)
 
 def main():
     """Main function to process all pillar directories."""
@@ -213,11 +259,23 @@ def main():
         'sustainability'
     ]
     
+    present = entry_names(base_dir, dirs_only=True)
+    
+    filepaths = []
+    file_pillars = []
     for pillar in pillars:
-        pillar_dir = os.path.join(base_dir, pillar)
-        if os.path.isdir(pillar_dir):
+        if pillar in present:
+            pillar_files = list_question_files(os.path.join(base_dir, pillar))
+            filepaths.extend(pillar_files)
+            file_pillars.extend([pillar] * len(pillar_files))
+    
+    # Results come back in order, so each header is printed as its pillar's first file is styled
+    current_pillar = None
+    for pillar, filepath in zip(file_pillars, process_files(filepaths)):
+        if pillar != current_pillar:
             print(f"Processing {pillar} pillar...")
-            process_directory(pillar_dir)
+            current_pillar = pillar
+        print(f"Styled {filepath}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Helper shared by the docs scripts for listing directory entries.
+"""
+
+import os
+
+def entry_names(directory, dirs_only=False):
+    """Return the names of the entries in a directory, or an empty set if it does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            if dirs_only:
+                return {entry.name for entry in entries if entry.is_dir()}
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
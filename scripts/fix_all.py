@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Script to apply styling and all link fixes to the docs in a single pass.
+
+Each markdown file is read once, run through the same transformations as
+apply_styling.py, fix_all_pillar_links.py, fix_security_links.py,
+fix_relative_links.py and fix_security_relative_paths.py (in that order),
+and written back only if something changed.
+
+Files whose mtime and size match the entry in .docs-cache.json are skipped;
+delete that file to force a full run after changing any of the fixes.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import apply_styling
+import fix_all_pillar_links
+import fix_relative_links
+import fix_security_links
+import fix_security_relative_paths
+from fix_relative_links import PILLARS
+
+CACHE_FILE = './.docs-cache.json'
+
+def load_cache():
+    """Load the mtime/size of every file processed by a previous run."""
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_cache(cache):
+    """Save the mtime/size of every processed file."""
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+def file_key(file_path):
+    """Return the (mtime, size) key used to detect changed files."""
+    st = os.stat(file_path)
+    return [st.st_mtime_ns, st.st_size]
+
+def fix_content(content, pillar_dir, filename):
+    """Apply every docs transformation to the content of a single file."""
+    pillar_prefix = PILLARS.get(pillar_dir)
+
+    if pillar_prefix and filename != 'index.md':
+        content = apply_styling.convert_to_styled_format(content)
+
+    content = fix_all_pillar_links.fix_pillar_links_content(content)
+
+    if pillar_dir == 'security':
+        content = fix_security_links.fix_security_links_content(content)
+
+    if pillar_prefix:
+        if filename == 'index.md':
+            content = fix_relative_links.fix_pillar_index_links_content(content, pillar_prefix)
+            if pillar_dir == 'security':
+                content = fix_security_relative_paths.fix_security_paths_content(content)
+        else:
+            content = fix_relative_links.fix_pillar_question_links_content(content, pillar_prefix)
+
+    return content
+
+def fix_file(file_path, pillar_dir, filename):
+    """Fix a single file, returning True if it was updated."""
+
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+
+    updated_content = fix_content(content, pillar_dir, filename)
+
+    # Write back if content changed
+    if content != updated_content:
+        path.write_text(updated_content, encoding='utf-8')
+        print(f"Fixed {file_path}")
+        return True
+
+    return False
+
+def main():
+    """Main function to fix all docs in one walk."""
+
+    docs_dir = './docs'
+    files_updated = 0
+    cache = load_cache()
+
+    for root, dirs, files in os.walk(docs_dir):
+        # Only files directly inside a pillar directory get pillar-specific fixes
+        pillar_dir = os.path.relpath(root, docs_dir)
+        for filename in files:
+            if filename.endswith('.md'):
+                file_path = os.path.join(root, filename)
+                if cache.get(file_path) == file_key(file_path):
+                    continue
+                if fix_file(file_path, pillar_dir, filename):
+                    files_updated += 1
+                cache[file_path] = file_key(file_path)
+
+    save_cache(cache)
+    print(f"Updated {files_updated} files total")
+
+if __name__ == "__main__":
+    main()
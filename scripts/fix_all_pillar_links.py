@@ -5,16 +5,14 @@ Script to fix all pillar links to include proper .html extensions
 
 import os
 import re
+from pathlib import Path
 
-def fix_pillar_links(file_path):
-    """Fix pillar links in a file"""
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match pillar links that need fixing
-    # This will match: href="./SEC01", href="./REL01", href="./COST01", etc.
-    pattern = r'href="(\./[A-Z]+\d+(?:-BP\d+)?)"'
+# Pattern to match pillar links that need fixing
+# This will match: href="./SEC01", href="./REL01", href="./COST01", etc.
+PILLAR_LINK_RE = re.compile(r'href="(\./[A-Z]+\d+(?:-BP\d+)?)"')
+
+def fix_pillar_links_content(content):
+    """Return content with pillar links fixed"""
     
     def replace_link(match):
         link = match.group(1)
@@ -23,12 +21,19 @@ def fix_pillar_links(file_path):
         return f'href="{new_link}"'
     
     # Replace all matches
-    updated_content = re.sub(pattern, replace_link, content)
+    return PILLAR_LINK_RE.sub(replace_link, content)
+
+def fix_pillar_links(file_path):
+    """Fix pillar links in a file"""
+    
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+    
+    updated_content = fix_pillar_links_content(content)
     
     # Write back if content changed
     if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
+        path.write_text(updated_content, encoding='utf-8')
         print(f"Fixed links in {file_path}")
         return True
     
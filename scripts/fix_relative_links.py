@@ -5,94 +5,106 @@ Script to fix relative links within pillar directories
 
 import os
 import re
+from pathlib import Path
 
-def fix_pillar_index_links(file_path, pillar_name):
-    """Fix links in pillar index files to use relative paths"""
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match pillar links that need fixing
-    # This will match: href="SEC01.html", href="SEC01-BP01.html", etc.
-    pattern = rf'href="({pillar_name}\d+(?:-BP\d+)?\.html)"'
+# Define pillar mappings
+PILLARS = {
+    'security': 'SEC',
+    'reliability': 'REL',
+    'cost-optimization': 'COST',
+    'performance-efficiency': 'PERF',
+    'operational-excellence': 'OPS',
+    'sustainability': 'SUS'
+}
+
+# Single pattern matching links for every pillar prefix
+# This will match: href="SEC01.html", href="REL02-BP03.html", etc.
+PILLAR_LINK_RE = re.compile(r'href="((' + '|'.join(PILLARS.values()) + r')\d+(-BP\d+)?\.html)"')
+
+def fix_pillar_index_links_content(content, pillar_name):
+    """Return content with links in pillar index files using relative paths"""
     
     def replace_link(match):
+        # Only links to this pillar's own pages are fixed
+        if match.group(2) != pillar_name:
+            return match.group(0)
         link = match.group(1)
         # Add ./ prefix for relative path
         new_link = './' + link
         return f'href="{new_link}"'
     
     # Replace all matches
-    updated_content = re.sub(pattern, replace_link, content)
+    return PILLAR_LINK_RE.sub(replace_link, content)
+
+def fix_pillar_index_links(file_path, pillar_name):
+    """Fix links in pillar index files to use relative paths"""
+    
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+    
+    updated_content = fix_pillar_index_links_content(content, pillar_name)
     
     # Write back if content changed
     if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
+        path.write_text(updated_content, encoding='utf-8')
         print(f"Fixed relative links in {file_path}")
         return True
     
     return False
 
-def fix_pillar_question_links(file_path, pillar_name):
-    """Fix links in pillar question files (like SEC01.md) to use relative paths"""
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match best practice links that need fixing
-    # This will match: href="SEC01-BP01.html", etc.
-    pattern = rf'href="({pillar_name}\d+-BP\d+\.html)"'
+def fix_pillar_question_links_content(content, pillar_name):
+    """Return content with links in pillar question files (like SEC01.md) using relative paths"""
     
     def replace_link(match):
+        # Only links to this pillar's best practice pages are fixed
+        if match.group(2) != pillar_name or not match.group(3):
+            return match.group(0)
         link = match.group(1)
         # Add ./ prefix for relative path
         new_link = './' + link
         return f'href="{new_link}"'
     
     # Replace all matches
-    updated_content = re.sub(pattern, replace_link, content)
+    return PILLAR_LINK_RE.sub(replace_link, content)
+
+def fix_pillar_question_links(file_path, pillar_name):
+    """Fix links in pillar question files (like SEC01.md) to use relative paths"""
+    
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+    
+    updated_content = fix_pillar_question_links_content(content, pillar_name)
     
     # Write back if content changed
     if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
+        path.write_text(updated_content, encoding='utf-8')
         print(f"Fixed relative links in {file_path}")
         return True
     
     return False
 
+def fix_file(file_path, pillar_name, filename):
+    """Fix relative links in a pillar file, dispatching on whether it is the index"""
+    
+    if filename == 'index.md':
+        return fix_pillar_index_links(file_path, pillar_name)
+    return fix_pillar_question_links(file_path, pillar_name)
+
 def main():
     """Main function to fix all relative links"""
     
-    # Define pillar mappings
-    pillars = {
-        'security': 'SEC',
-        'reliability': 'REL',
-        'cost-optimization': 'COST',
-        'performance-efficiency': 'PERF',
-        'operational-excellence': 'OPS',
-        'sustainability': 'SUS'
-    }
-    
+    docs_dir = './docs'
     files_updated = 0
     
-    for pillar_dir, pillar_prefix in pillars.items():
-        pillar_path = f'./docs/{pillar_dir}'
-        
-        if os.path.exists(pillar_path):
-            # Fix index.md file
-            index_file = os.path.join(pillar_path, 'index.md')
-            if os.path.exists(index_file):
-                if fix_pillar_index_links(index_file, pillar_prefix):
+    # One walk over the docs; only files directly inside a pillar directory are fixed
+    for root, dirs, files in os.walk(docs_dir):
+        pillar_prefix = PILLARS.get(os.path.relpath(root, docs_dir))
+        if not pillar_prefix:
+            continue
+        for filename in files:
+            if filename.endswith('.md'):
+                if fix_file(os.path.join(root, filename), pillar_prefix, filename):
                     files_updated += 1
-            
-            # Fix question files (like SEC01.md, SEC02.md, etc.)
-            for filename in os.listdir(pillar_path):
-                if filename.endswith('.md') and filename != 'index.md':
-                    file_path = os.path.join(pillar_path, filename)
-                    if fix_pillar_question_links(file_path, pillar_prefix):
-                        files_updated += 1
     
     print(f"Updated {files_updated} files total")
 
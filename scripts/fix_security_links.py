@@ -5,16 +5,14 @@ Script to fix security links to include proper paths and .html extensions
 
 import os
 import re
+from pathlib import Path
 
-def fix_security_links(file_path):
-    """Fix security links in a file"""
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match SEC links that need fixing
-    # This will match: href="./SEC01" or href="./SEC01-BP01" etc.
-    pattern = r'href="(\./SEC\d+(?:-BP\d+)?)"'
+# Pattern to match SEC links that need fixing
+# This will match: href="./SEC01" or href="./SEC01-BP01" etc.
+SECURITY_LINK_RE = re.compile(r'href="(\./SEC\d+(?:-BP\d+)?)"')
+
+def fix_security_links_content(content):
+    """Return content with security links fixed"""
     
     def replace_link(match):
         link = match.group(1)
@@ -23,12 +21,19 @@ def fix_security_links(file_path):
         return f'href="{new_link}"'
     
     # Replace all matches
-    updated_content = re.sub(pattern, replace_link, content)
+    return SECURITY_LINK_RE.sub(replace_link, content)
+
+def fix_security_links(file_path):
+    """Fix security links in a file"""
+    
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+    
+    updated_content = fix_security_links_content(content)
     
     # Write back if content changed
     if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
+        path.write_text(updated_content, encoding='utf-8')
         print(f"Fixed links in {file_path}")
         return True
     
@@ -41,11 +46,11 @@ def main():
     files_updated = 0
     
     # Process all markdown files in the security directory
-    for filename in os.listdir(security_dir):
-        if filename.endswith('.md'):
-            file_path = os.path.join(security_dir, filename)
-            if fix_security_links(file_path):
-                files_updated += 1
+    with os.scandir(security_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.md'):
+                if fix_security_links(entry.path):
+                    files_updated += 1
     
     print(f"Updated {files_updated} files")
 
@@ -5,16 +5,14 @@ Script to fix security links to use explicit security/ path
 
 import os
 import re
+from pathlib import Path
 
-def fix_security_links(file_path):
-    """Fix security links to use explicit security/ path"""
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match SEC links that need fixing
-    # This will match: href="./SEC01.html" or href="./SEC01-BP01.html" etc.
-    pattern = r'href="(\./SEC\d+(?:-BP\d+)?\.html)"'
+# Pattern to match SEC links that need fixing
+# This will match: href="./SEC01.html" or href="./SEC01-BP01.html" etc.
+SECURITY_LINK_RE = re.compile(r'href="(\./SEC\d+(?:-BP\d+)?\.html)"')
+
+def fix_security_paths_content(content):
+    """Return content with security links using explicit security/ path"""
     
     def replace_link(match):
         link = match.group(1)
@@ -23,12 +21,19 @@ def fix_security_links(file_path):
         return f'href="{new_link}"'
     
     # Replace all matches
-    updated_content = re.sub(pattern, replace_link, content)
+    return SECURITY_LINK_RE.sub(replace_link, content)
+
+def fix_security_links(file_path):
+    """Fix security links to use explicit security/ path"""
+    
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
+    
+    updated_content = fix_security_paths_content(content)
     
     # Write back if content changed
     if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
+        path.write_text(updated_content, encoding='utf-8')
         print(f"Fixed security links in {file_path}")
         return True
     
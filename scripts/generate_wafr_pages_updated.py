@@ -4,134 +4,128 @@ Script to generate Markdown files for AWS Well-Architected Framework questions u
 """
 
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from string import Template
+
+from docs_listing import entry_names
+
+DOCS_DIR = Path("docs")
+
+Question = namedtuple('Question', ['id', 'title'])
+Pillar = namedtuple('Pillar', ['abbr', 'nav_order', 'questions'])
 
 # Define the pillars and their questions (updated from the latest AWS Well-Architected Framework)
 PILLARS = {
-    "Operational Excellence": {
-        "abbr": "OPS",
-        "nav_order": 2,
-        "questions": [
-            {"id": "OPS01", "title": "How do you determine what your priorities are?"},
-            {"id": "OPS02", "title": "How do you structure your organization to support your business outcomes?"},
-            {"id": "OPS03", "title": "How does your organizational culture support your business outcomes?"},
-            {"id": "OPS04", "title": "How do you design your workload so that you can understand its state?"},
-            {"id": "OPS05", "title": "How do you reduce defects, ease remediation, and improve flow into production?"},
-            {"id": "OPS06", "title": "How do you mitigate deployment risks?"},
-            {"id": "OPS07", "title": "How do you know that you are ready to support a workload?"},
-            {"id": "OPS08", "title": "How do you understand the health of your workload?"},
-            {"id": "OPS09", "title": "How do you understand the health of your operations?"},
-            {"id": "OPS10", "title": "How do you manage workload and operations events?"},
-            {"id": "OPS11", "title": "How do you evolve operations?"}
+    "Operational Excellence": Pillar(
+        abbr="OPS",
+        nav_order=2,
+        questions=[
+            Question("OPS01", "How do you determine what your priorities are?"),
+            Question("OPS02", "How do you structure your organization to support your business outcomes?"),
+            Question("OPS03", "How does your organizational culture support your business outcomes?"),
+            Question("OPS04", "How do you design your workload so that you can understand its state?"),
+            Question("OPS05", "How do you reduce defects, ease remediation, and improve flow into production?"),
+            Question("OPS06", "How do you mitigate deployment risks?"),
+            Question("OPS07", "How do you know that you are ready to support a workload?"),
+            Question("OPS08", "How do you understand the health of your workload?"),
+            Question("OPS09", "How do you understand the health of your operations?"),
+            Question("OPS10", "How do you manage workload and operations events?"),
+            Question("OPS11", "How do you evolve operations?")
         ]
-    },
-    "Security": {
-        "abbr": "SEC",
-        "nav_order": 3,
-        "questions": [
-            {"id": "SEC01", "title": "How do you securely operate your workload?"},
-            {"id": "SEC02", "title": "How do you manage identities for people and machines?"},
-            {"id": "SEC03", "title": "How do you manage permissions for people and machines?"},
-            {"id": "SEC04", "title": "How do you detect and investigate security events?"},
-            {"id": "SEC05", "title": "How do you protect your network resources?"},
-            {"id": "SEC06", "title": "How do you protect your compute resources?"},
-            {"id": "SEC07", "title": "How do you classify your data?"},
-            {"id": "SEC08", "title": "How do you protect your data at rest?"},
-            {"id": "SEC09", "title": "How do you protect your data in transit?"},
-            {"id": "SEC10", "title": "How do you anticipate, respond to, and recover from incidents?"},
-            {"id": "SEC11", "title": "How do you securely manage your AI workloads?"}
+    ),
+    "Security": Pillar(
+        abbr="SEC",
+        nav_order=3,
+        questions=[
+            Question("SEC01", "How do you securely operate your workload?"),
+            Question("SEC02", "How do you manage identities for people and machines?"),
+            Question("SEC03", "How do you manage permissions for people and machines?"),
+            Question("SEC04", "How do you detect and investigate security events?"),
+            Question("SEC05", "How do you protect your network resources?"),
+            Question("SEC06", "How do you protect your compute resources?"),
+            Question("SEC07", "How do you classify your data?"),
+            Question("SEC08", "How do you protect your data at rest?"),
+            Question("SEC09", "How do you protect your data in transit?"),
+            Question("SEC10", "How do you anticipate, respond to, and recover from incidents?"),
+            Question("SEC11", "How do you securely manage your AI workloads?")
         ]
-    },
-    "Reliability": {
-        "abbr": "REL",
-        "nav_order": 4,
-        "questions": [
-            {"id": "REL01", "title": "How do you manage service quotas and constraints?"},
-            {"id": "REL02", "title": "How do you plan your network topology?"},
-            {"id": "REL03", "title": "How do you design your workload service architecture?"},
-            {"id": "REL04", "title": "How do you design interactions in a distributed system to prevent failures?"},
-            {"id": "REL05", "title": "How do you design interactions in a distributed system to mitigate or withstand failures?"},
-            {"id": "REL06", "title": "How do you monitor workload resources?"},
-            {"id": "REL07", "title": "How do you design your workload to adapt to changes in demand?"},
-            {"id": "REL08", "title": "How do you implement change?"},
-            {"id": "REL09", "title": "How do you back up data?"},
-            {"id": "REL10", "title": "How do you use fault isolation to protect your workload?"},
-            {"id": "REL11", "title": "How do you design your workload to withstand component failures?"},
-            {"id": "REL12", "title": "How do you test reliability?"},
-            {"id": "REL13", "title": "How do you plan for disaster recovery?"}
+    ),
+    "Reliability": Pillar(
+        abbr="REL",
+        nav_order=4,
+        questions=[
+            Question("REL01", "How do you manage service quotas and constraints?"),
+            Question("REL02", "How do you plan your network topology?"),
+            Question("REL03", "How do you design your workload service architecture?"),
+            Question("REL04", "How do you design interactions in a distributed system to prevent failures?"),
+            Question("REL05", "How do you design interactions in a distributed system to mitigate or withstand failures?"),
+            Question("REL06", "How do you monitor workload resources?"),
+            Question("REL07", "How do you design your workload to adapt to changes in demand?"),
+            Question("REL08", "How do you implement change?"),
+            Question("REL09", "How do you back up data?"),
+            Question("REL10", "How do you use fault isolation to protect your workload?"),
+            Question("REL11", "How do you design your workload to withstand component failures?"),
+            Question("REL12", "How do you test reliability?"),
+            Question("REL13", "How do you plan for disaster recovery?")
         ]
-    },
-    "Performance Efficiency": {
-        "abbr": "PERF",
-        "nav_order": 5,
-        "questions": [
-            {"id": "PERF01", "title": "How do you select the best performing architecture?"},
-            {"id": "PERF02", "title": "How do you select your compute solution?"},
-            {"id": "PERF03", "title": "How do you select your storage solution?"},
-            {"id": "PERF04", "title": "How do you select your database solution?"},
-            {"id": "PERF05", "title": "How do you configure your networking solution?"},
-            {"id": "PERF06", "title": "How do you evolve your workload to take advantage of new releases?"},
-            {"id": "PERF07", "title": "How do you monitor your resources to ensure they are performing?"},
-            {"id": "PERF08", "title": "How do you use tradeoffs to improve performance?"}
+    ),
+    "Performance Efficiency": Pillar(
+        abbr="PERF",
+        nav_order=5,
+        questions=[
+            Question("PERF01", "How do you select the best performing architecture?"),
+            Question("PERF02", "How do you select your compute solution?"),
+            Question("PERF03", "How do you select your storage solution?"),
+            Question("PERF04", "How do you select your database solution?"),
+            Question("PERF05", "How do you configure your networking solution?"),
+            Question("PERF06", "How do you evolve your workload to take advantage of new releases?"),
+            Question("PERF07", "How do you monitor your resources to ensure they are performing?"),
+            Question("PERF08", "How do you use tradeoffs to improve performance?")
         ]
-    },
-    "Cost Optimization": {
-        "abbr": "COST",
-        "nav_order": 6,
-        "questions": [
-            {"id": "COST01", "title": "How do you implement cloud financial management?"},
-            {"id": "COST02", "title": "How do you govern usage?"},
-            {"id": "COST03", "title": "How do you monitor usage and cost?"},
-            {"id": "COST04", "title": "How do you decommission resources?"},
-            {"id": "COST05", "title": "How do you evaluate cost when you select services?"},
-            {"id": "COST06", "title": "How do you meet cost targets when you select resource type, size and number?"},
-            {"id": "COST07", "title": "How do you use pricing models to reduce cost?"},
-            {"id": "COST08", "title": "How do you plan for data transfer charges?"},
-            {"id": "COST09", "title": "How do you manage demand, and supply resources?"},
-            {"id": "COST10", "title": "How do you evaluate new services?"},
-            {"id": "COST11", "title": "How do you optimize your organization's expenditure on generative AI?"}
+    ),
+    "Cost Optimization": Pillar(
+        abbr="COST",
+        nav_order=6,
+        questions=[
+            Question("COST01", "How do you implement cloud financial management?"),
+            Question("COST02", "How do you govern usage?"),
+            Question("COST03", "How do you monitor usage and cost?"),
+            Question("COST04", "How do you decommission resources?"),
+            Question("COST05", "How do you evaluate cost when you select services?"),
+            Question("COST06", "How do you meet cost targets when you select resource type, size and number?"),
+            Question("COST07", "How do you use pricing models to reduce cost?"),
+            Question("COST08", "How do you plan for data transfer charges?"),
+            Question("COST09", "How do you manage demand, and supply resources?"),
+            Question("COST10", "How do you evaluate new services?"),
+            Question("COST11", "How do you optimize your organization's expenditure on generative AI?")
         ]
-    },
-    "Sustainability": {
-        "abbr": "SUS",
-        "nav_order": 7,
-        "questions": [
-            {"id": "SUS01", "title": "How do you select Regions to support your sustainability goals?"},
-            {"id": "SUS02", "title": "How do you take advantage of user behavior patterns to support your sustainability goals?"},
-            {"id": "SUS03", "title": "How do you take advantage of software and architecture patterns to support your sustainability goals?"},
-            {"id": "SUS04", "title": "How do you take advantage of data access and usage patterns to support your sustainability goals?"},
-            {"id": "SUS05", "title": "How do you take advantage of hardware patterns to support your sustainability goals?"},
-            {"id": "SUS06", "title": "How do you take advantage of development and deployment process to support your sustainability goals?"}
+    ),
+    "Sustainability": Pillar(
+        abbr="SUS",
+        nav_order=7,
+        questions=[
+            Question("SUS01", "How do you select Regions to support your sustainability goals?"),
+            Question("SUS02", "How do you take advantage of user behavior patterns to support your sustainability goals?"),
+            Question("SUS03", "How do you take advantage of software and architecture patterns to support your sustainability goals?"),
+            Question("SUS04", "How do you take advantage of data access and usage patterns to support your sustainability goals?"),
+            Question("SUS05", "How do you take advantage of hardware patterns to support your sustainability goals?"),
+            Question("SUS06", "How do you take advantage of development and deployment process to support your sustainability goals?")
         ]
-    }
+    )
 }
 
-def generate_question_file(pillar, question, question_number):
-    """Generate a Markdown file for a specific question."""
-    pillar_dir = pillar.lower().replace(' ', '-')
-    question_id = question['id']
-    question_title = question['title']
-    
-    # Create directory if it doesn't exist
-    os.makedirs(f"docs/{pillar_dir}", exist_ok=True)
-    
-    # Create file path
-    file_path = f"docs/{pillar_dir}/{question_id}.md"
-    
-    # Skip if file already exists
-    if os.path.exists(file_path):
-        print(f"File already exists: {file_path} - skipping")
-        return
-    
-    # Create file content
-    content = f"""---
-title: {question_id} - {question_title}
+# Page template for a single question, parsed once at import time
+QUESTION_TEMPLATE = Template("""---
+title: $question_id - $question_title
 layout: default
-parent: {pillar}
-nav_order: {question_number}
+parent: $pillar
+nav_order: $nav_order
 ---
 
 <div class="pillar-header">
-  <h1>{question_id}: {question_title}</h1>
+  <h1>$question_id: $question_title</h1>
   <p>*This page contains guidance for addressing this question from the AWS Well-Architected Framework.*</p>
 </div>
 
@@ -195,31 +189,106 @@ nav_order: {question_number}
 <div class="related-resources">
   <h2>Related Resources</h2>
   <ul>
-    <li><a href="https://docs.aws.amazon.com/wellarchitected/latest/{pillar_dir.replace('-', '')}-pillar/welcome.html">AWS Well-Architected Framework - {pillar} Pillar</a></li>
+    <li><a href="https://docs.aws.amazon.com/wellarchitected/latest/$pillar_slug-pillar/welcome.html">AWS Well-Architected Framework - $pillar Pillar</a></li>
     <li><a href="https://aws.amazon.com/">Related Documentation Link 1</a></li>
     <li><a href="https://aws.amazon.com/">Related Documentation Link 2</a></li>
   </ul>
 </div>
-"""
+""")
+
+def generate_question_file(pillar, pillar_path, pillar_slug, question, question_number, existing, log):
+    """Render the Markdown file for a specific question, returning (file_path, content) or None if it exists."""
+    question_id = question.id
+    question_title = question.title
     
-    # Write content to file
-    with open(file_path, 'w') as f:
-        f.write(content)
+    # Create file path
+    file_path = pillar_path / f"{question_id}.md"
     
-    print(f"Generated file: {file_path}")
+    # Skip if file already exists
+    if file_path.name in existing:
+        log.append(f"File already exists: {file_path} - skipping")
+        return
+    
+    # Create file content
+    content = QUESTION_TEMPLATE.substitute(
+        question_id=question_id,
+        question_title=question_title,
+        pillar=pillar,
+        pillar_slug=pillar_slug,
+        nav_order=question_number
+    )
+    
+    return file_path, content
+
+def temp_path(file_path):
+    """Return the hidden temporary path a page is written to before it is moved into place."""
+    return file_path.with_name(f".{file_path.name}.tmp")
+
+def write_file(file_path, content):
+    """Write a single generated page to its temporary path, returning that path."""
+    # Pages are small, so skip the io wrapper layers and write the encoded bytes directly
+    data = memoryview(content.encode('utf-8'))
+    tmp_path = temp_path(file_path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    return tmp_path
+
+def write_batch(files):
+    """Write all generated (file_path, content) pairs in one pass, returning the written paths."""
+    # Create each directory before any worker starts
+    for directory in sorted({file_path.parent for file_path, _ in files}):
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    # Pages are independent and writing is I/O-bound, so threads overlap the writes
+    file_paths = [file_path for file_path, _ in files]
+    contents = [content for _, content in files]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        tmp_paths = list(executor.map(write_file, file_paths, contents))
+    
+    # Flush every temporary page to disk once, then move them into place, so a crash
+    # never leaves a partial page under a name that later runs would skip
+    if tmp_paths:
+        os.sync()
+    for tmp_path, file_path in zip(tmp_paths, file_paths):
+        os.replace(tmp_path, file_path)
+    
+    return file_paths
 
 def main():
     """Main function to generate all WAFR question pages."""
-    print("Generating Markdown files for each question...")
+    log = ["Generating Markdown files for each question..."]
     
+    files = []
     for pillar, data in PILLARS.items():
-        questions = data["questions"]
-        print(f"\nProcessing {pillar} pillar ({len(questions)} questions):")
+        questions = data.questions
+        log.append(f"\nProcessing {pillar} pillar ({len(questions)} questions):")
+        
+        # Derive the directory, URL slug and output path for this pillar
+        pillar_dir = pillar.lower().replace(' ', '-')
+        pillar_slug = pillar_dir.replace('-', '')
+        pillar_path = DOCS_DIR / pillar_dir
+        
+        existing = entry_names(pillar_path)
+        
+        # Skip the pillar if every question page already exists
+        if existing.issuperset(f"{question.id}.md" for question in questions):
+            log.append(f"All {pillar} question files already exist - skipping")
+            continue
         
         for i, question in enumerate(questions, 1):
-            generate_question_file(pillar, question, i)
+            generated = generate_question_file(pillar, pillar_path, pillar_slug, question, i, existing, log)
+            if generated:
+                files.append(generated)
+    
+    for file_path in write_batch(files):
+        log.append(f"Generated file: {file_path}")
     
-    print("\nDone! All question files have been generated.")
+    log.append("\nDone! All question files have been generated.")
+    print("\n".join(log))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Script to apply the pillar order and SEC02 title updates in a single pass.
+
+Each pillar index.md and each docs/security/SEC02*.md file is read once, run
+through the same transformations as update_pillar_order.py and
+update_sec02_title.py, and written back only if something changed. This
+avoids rewriting docs/security/index.md twice when both updates are run.
+"""
+
+import os
+from pathlib import Path
+
+from docs_listing import entry_names
+from update_pillar_order import PILLAR_ORDER, update_nav_order_content
+from update_sec02_title import SECURITY_DIR, sec02_targets, update_sec02_title_content
+
+DOCS_DIR = "./docs"
+
+def collect_files():
+    """Return {file_path: nav_order or None} for every file either update touches."""
+    files = {}
+    
+    pillar_dirs = entry_names(DOCS_DIR, dirs_only=True)
+    for pillar, nav_order in PILLAR_ORDER.items():
+        if pillar in pillar_dirs:
+            files[os.path.join(DOCS_DIR, pillar, "index.md")] = nav_order
+    
+    security_names = entry_names(SECURITY_DIR)
+    if 'index.md' in security_names:
+        files.setdefault(os.path.join(SECURITY_DIR, 'index.md'), None)
+    for name in sec02_targets(security_names):
+        files[os.path.join(SECURITY_DIR, name)] = None
+    
+    return files
+
+def apply_all_updates(file_path, nav_order):
+    """Apply every update to a single file, returning True if it was written."""
+    path = Path(file_path)
+    try:
+        content = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return False
+    
+    updated_content = content
+    if nav_order is not None:
+        updated_content = update_nav_order_content(updated_content, nav_order)
+    if os.path.basename(os.path.dirname(file_path)) == 'security':
+        updated_content, _ = update_sec02_title_content(updated_content)
+    
+    # Write back only if content changed
+    if content != updated_content:
+        path.write_text(updated_content, encoding='utf-8')
+        return True
+    
+    return False
+
+def main():
+    """Main function to apply all updates in one pass."""
+    log = []
+    files_updated = 0
+    
+    for file_path, nav_order in sorted(collect_files().items()):
+        if apply_all_updates(file_path, nav_order):
+            log.append(f"Updated {file_path}")
+            files_updated += 1
+    
+    log.append(f"Updated {files_updated} files total")
+    print("\n".join(log))
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@
 Script to update the order of pillars in the navigation.
 """
 
-import os
 import re
 
 # Define the new order of pillars
@@ -16,32 +15,78 @@ PILLAR_ORDER = {
     "sustainability": 7
 }
 
-def update_pillar_nav_order(pillar_dir, nav_order):
+# Front matter lines, matched without stripping each line; bytes for files, str for in-memory content
+BYTE_PATTERNS = (re.compile(rb'\s*---\s*$'), re.compile(rb'\s*nav_order:'))
+TEXT_PATTERNS = (re.compile(r'\s*---\s*$'), re.compile(r'\s*nav_order:'))
+
+def find_nav_order_line(lines, patterns=BYTE_PATTERNS):
+    """Return (offset, line) of the front matter nav_order line, or None if there is none."""
+    separator_re, nav_order_re = patterns
+    
+    # Only the front matter is scanned, stopping at the closing '---'
+    offset = 0
+    separators = 0
+    for line in lines:
+        if separator_re.match(line):
+            separators += 1
+            if separators == 2:
+                return None
+        elif nav_order_re.match(line):
+            return offset, line
+        offset += len(line)
+    
+    return None
+
+def update_nav_order_content(content, nav_order):
+    """Return content with the front matter nav_order set to nav_order."""
+    found = find_nav_order_line(content.splitlines(keepends=True), TEXT_PATTERNS)
+    if found is None:
+        return content
+    
+    offset, line = found
+    return content[:offset] + f'nav_order: {nav_order}\n' + content[offset + len(line):]
+
+def update_pillar_nav_order(pillar_dir, nav_order, log):
     """Update the nav_order in a pillar's index.md file."""
     file_path = f"./docs/{pillar_dir}/index.md"
     
-    if not os.path.exists(file_path):
-        print(f"Warning: {file_path} does not exist")
+    try:
+        f = open(file_path, 'r+b')
+    except FileNotFoundError:
+        log.append(f"Warning: {file_path} does not exist")
         return
     
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
-    # Update the nav_order in the front matter
-    for i, line in enumerate(lines):
-        if line.strip().startswith('nav_order:'):
-            lines[i] = f'nav_order: {nav_order}\n'
-            break
-    
-    with open(file_path, 'w') as f:
-        f.writelines(lines)
+    with f:
+        # The page body is never read unless the line changes length
+        found = find_nav_order_line(f)
+        if found is not None:
+            offset, line = found
+            # Keep the line's own terminator so CRLF files stay consistent
+            new_line = f'nav_order: {nav_order}'.encode('utf-8') + line[len(line.rstrip(b'\r\n')):]
+            if line == new_line:
+                # Already up to date, so skip the write entirely
+                log.append(f"nav_order already {nav_order} in {file_path} - unchanged")
+                return
+            if len(line) == len(new_line):
+                # Same length, so patch the line in place
+                f.seek(offset)
+                f.write(new_line)
+            else:
+                # Different length, so rewrite everything from this line on
+                f.seek(offset + len(line))
+                rest = f.read()
+                f.seek(offset)
+                f.write(new_line + rest)
+                f.truncate()
     
-    print(f"Updated nav_order to {nav_order} in {file_path}")
+    log.append(f"Updated nav_order to {nav_order} in {file_path}")
 
 def main():
     """Main function to update all pillar nav orders."""
+    log = []
     for pillar, nav_order in PILLAR_ORDER.items():
-        update_pillar_nav_order(pillar, nav_order)
+        update_pillar_nav_order(pillar, nav_order, log)
+    print("\n".join(log))
 
 if __name__ == "__main__":
     main()
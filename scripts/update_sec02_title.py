@@ -3,50 +3,58 @@
 Script to update SEC02 title from 'identities' to 'authentication'.
 """
 
-import os
 import re
+from pathlib import Path
 
-def update_file(file_path):
+from docs_listing import entry_names
+
+# Matches the old title in both the "SEC02 - ..." and "SEC02: ..." formats
+SEC02_TITLE_RE = re.compile(r"SEC02( -|:) How do you manage identities for people and machines\?")
+
+SECURITY_DIR = "./docs/security"
+
+def update_sec02_title_content(content):
+    """Return content with the SEC02 title updated and the number of replacements."""
+    # Replace the title in both formats in a single pass
+    return SEC02_TITLE_RE.subn(
+        r"SEC02\1 How do you manage authentication for people and machines?",
+        content
+    )
+
+def sec02_targets(names):
+    """Return the sorted SEC02*.md page names among names."""
+    return sorted(name for name in names if name.startswith('SEC02') and name.endswith('.md'))
+
+def update_file(file_path, log):
     """Update the SEC02 title in a file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
+    path = Path(file_path)
+    content = path.read_text(encoding='utf-8')
     
-    # Replace the title in different formats
-    updated_content = content.replace(
-        "SEC02 - How do you manage identities for people and machines?",
-        "SEC02 - How do you manage authentication for people and machines?"
-    )
-    updated_content = updated_content.replace(
-        "SEC02: How do you manage identities for people and machines?",
-        "SEC02: How do you manage authentication for people and machines?"
-    )
+    updated_content, count = update_sec02_title_content(content)
     
-    if content != updated_content:
-        with open(file_path, 'w') as f:
-            f.write(updated_content)
-        print(f"Updated {file_path}")
+    if count:
+        path.write_text(updated_content, encoding='utf-8')
+        log.append(f"Updated {file_path}")
     else:
-        print(f"No changes needed in {file_path}")
+        log.append(f"No changes needed in {file_path}")
 
 def main():
     """Main function to update all relevant files."""
-    # List of files to update
-    files_to_update = [
-        "./docs/security/SEC02.md",
-        "./docs/security/SEC02-BP01.md",
-        "./docs/security/SEC02-BP02.md",
-        "./docs/security/SEC02-BP03.md",
-        "./docs/security/SEC02-BP04.md",
-        "./docs/security/SEC02-BP05.md",
-        "./docs/security/SEC02-BP06.md",
-        "./docs/security/index.md"
-    ]
+    log = []
+    
+    # Find every SEC02 page in the security directory
+    present = entry_names(SECURITY_DIR)
+    
+    files_to_update = sec02_targets(present)
+    if 'index.md' in present:
+        files_to_update.append('index.md')
+    else:
+        log.append(f"Warning: {SECURITY_DIR}/index.md does not exist")
+    
+    for filename in files_to_update:
+        update_file(f"{SECURITY_DIR}/{filename}", log)
     
-    for file_path in files_to_update:
-        if os.path.exists(file_path):
-            update_file(file_path)
-        else:
-            print(f"Warning: {file_path} does not exist")
+    print("\n".join(log))
 
 if __name__ == "__main__":
     main()